@@ -43,11 +43,14 @@ from qgis.PyQt.QtWidgets import (
     QToolButton,
 )
 
-from .modules import general as ge
 from .modules import logs_and_errors as lae
 from .modules.general import get_current_project
 from .modules.geopackage import move_layers_to_gpkg
-from .modules.layer_location import add_location_indicator
+from .modules.layer_location import (
+    add_location_indicator,
+    add_location_indicators,
+    clear_location_cache,
+)
 from .modules.main_interface import set_iface
 from .modules.rename import rename_layers, undo_rename_layers
 from .modules.resource_utils import resources
@@ -70,7 +73,6 @@ class UTECLayerTools(QObject):  # pylint: disable=too-many-instance-attributes
         self.project: QgsProject = get_current_project()
         self.iface: QgisInterface = iface
         self.msg_bar: QgsMessageBar | None = iface.messageBar()
-        ge.iface = iface
         set_iface(iface)
         self.plugin_dir: Path = Path(__file__).parent
         self.actions: list = []
@@ -332,10 +334,20 @@ class UTECLayerTools(QObject):  # pylint: disable=too-many-instance-attributes
     def _update_all_location_indicators(self) -> None:
         """Update location indicators for all layers in the project."""
         self._clear_all_location_indicators()
-        if root := self.project.layerTreeRoot():
-            for layer_node in root.findLayers():
-                if layer_node and (map_layer := layer_node.layer()):
-                    self._add_indicator_for_layer(map_layer.id())
+        clear_location_cache()
+        root: QgsLayerTree | None = self.project.layerTreeRoot()
+        if not root:
+            return
+
+        layers: list[QgsMapLayer] = [
+            map_layer
+            for layer_node in root.findLayers()
+            if layer_node and (map_layer := layer_node.layer())
+        ]
+        indicators = add_location_indicators(self.project, self.iface, layers)
+        for layer in layers:
+            if indicator := indicators.get(layer.id()):
+                self.location_indicators[layer] = indicator
 
     def _add_indicator_for_layer(self, layer_id: str) -> None:
         """Add a location indicator for a single layer.
@@ -390,6 +402,7 @@ class UTECLayerTools(QObject):  # pylint: disable=too-many-instance-attributes
         Args:
             layer_id: The ID of the layer that will be removed.
         """
+        clear_location_cache(layer_id)
         if layer_to_remove := next(
             (layer for layer in self.location_indicators if layer.id() == layer_id),
             None,
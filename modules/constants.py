@@ -4,7 +4,6 @@ This module contains shared constants and enumerations used across the plugin.
 """
 
 from collections.abc import Callable
-from dataclasses import dataclass
 from enum import Enum
 
 from qgis.core import Qgis, QgsMapLayer
@@ -25,55 +24,76 @@ LAYER_TYPES: dict = {
     QgsMapLayer.PluginLayer: "PluginLayer",
 }
 
+# Icons are created lazily (and only once) so that importing this module
+# does not construct a QIcon per enum member at plugin startup.
+_ICON_CACHE: dict[str, QIcon] = {}
 
-@dataclass
-class LayerLocationInfo:
-    """Holds display information for a layer's location."""
-
-    icon: QIcon
-    _tooltip_factory: Callable[[], str]
-
-    @property
-    def tooltip(self) -> str:
-        """Generate and return the translated tooltip.
-
-        Returns:
-            The translated tooltip string.
-        """
-        return self._tooltip_factory()
+# Translated tooltips are cached after the first access, since the
+# translation for a locale does not change during a QGIS session.
+_TOOLTIP_CACHE: dict[str, str] = {}
 
 
 # fmt: off
 # ruff: noqa: E501
-class LayerLocation(LayerLocationInfo, Enum):
+class LayerLocation(Enum):
     """Enumeration for layer locations with associated display info."""
 
     CLOUD = (
-        resources.icons.location_cloud,
+        "location_cloud",
         lambda: QCoreApplication.translate("LayerLocation", "<p>🔗<b>Cloud Layer</b>🔗</p>This layer is from a cloud-based service or database.<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     EMPTY = (
-        resources.icons.location_empty,
+        "location_empty",
         lambda: QCoreApplication.translate("LayerLocation", "<p>❓<b>Empty Layer</b>❓</p>This Layer does not contain any objects.<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     EXTERNAL = (
-        resources.icons.location_external,
+        "location_external",
         lambda: QCoreApplication.translate("LayerLocation", "<p>💥💥💥<b>Caution</b>💥💥💥</p>This layer is stored outside the project folder. Please move to the project folder.<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     FOLDER_NO_GPKG = (
-        resources.icons.location_folder_no_gpkg,
+        "location_folder_no_gpkg",
         lambda: QCoreApplication.translate("LayerLocation", "<p>⚠️<b>Layer in Project Folder but not GeoPackage</b>⚠️</p>This layer is stored in the project folder, but not in a GeoPackage. Consider saving to the Project-GeoPackage (a GeoPackage with the same name as the project file).<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     GPKG_FOLDER = (
-        resources.icons.location_gpkg_folder,
+        "location_gpkg_folder",
         lambda: QCoreApplication.translate("LayerLocation", "<p>⚠️<b>Layer in GeoPackge in Project Folder</b>⚠️</p>This layer is stored in a GeoPackage in the project folder, but not in the Project-GeoPackage. Consider saving to the Project-GeoPackage (a GeoPackage with the same name as the project file).<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     GPKG_PROJECT = (
-        resources.icons.location_gpkg_project,
+        "location_gpkg_project",
         lambda: QCoreApplication.translate("LayerLocation", "<p>👍<b>Layer in Project-Geopackage</b>👍</p>This layer is stored in the Project-GeoPackage (a GeoPackage with the same name as the project file).<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
     UNKNOWN = (
-        resources.icons.location_unknown,
+        "location_unknown",
         lambda: QCoreApplication.translate("LayerLocation", "<p>❓<b>Data Source Unknown</b>❓</p>The data source of this Layer could not be determined.<br><i>(Plugin: UTEC Layer Tools)</i>"),
     )
 # fmt: on
+
+    def __init__(self, icon_name: str, tooltip_factory: Callable[[], str]) -> None:
+        self._icon_name: str = icon_name
+        self._tooltip_factory: Callable[[], str] = tooltip_factory
+
+    @property
+    def icon(self) -> QIcon:
+        """Create (on first access) and return the location icon.
+
+        Returns:
+            The QIcon for this location.
+        """
+        icon: QIcon | None = _ICON_CACHE.get(self._icon_name)
+        if icon is None:
+            icon = getattr(resources.icons, self._icon_name)
+            _ICON_CACHE[self._icon_name] = icon
+        return icon
+
+    @property
+    def tooltip(self) -> str:
+        """Generate (on first access) and return the translated tooltip.
+
+        Returns:
+            The translated tooltip string.
+        """
+        tooltip: str | None = _TOOLTIP_CACHE.get(self._icon_name)
+        if tooltip is None:
+            tooltip = self._tooltip_factory()
+            _TOOLTIP_CACHE[self._icon_name] = tooltip
+        return tooltip
@@ -3,29 +3,138 @@
 This module contains the general functions.
 """
 
+import contextlib
+import sqlite3
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from osgeo import ogr
 from qgis.core import (
-    QgsLayerTreeGroup,
-    QgsLayerTreeLayer,
+    QgsLayerTree,
+    QgsLayerTreeNode,
     QgsMapLayer,
     QgsProject,
     QgsVectorDataProvider,
-    QgsVectorLayer,
 )
-from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QCoreApplication
 
 from .logs_and_errors import log_debug, raise_runtime_error, raise_user_error
+from .main_interface import get_iface
 
 if TYPE_CHECKING:
-    from qgis.core import QgsDataProvider, QgsLayerTreeNode
+    from collections.abc import Iterator
+
+    from qgis.core import QgsDataProvider
     from qgis.gui import QgsLayerTreeView
 
 
-iface: QgisInterface | None = None
+# Resolved once at import: looking the capability flag up through the
+# SIP enum binding on every call adds up in per-layer loops.
+_DELETE_ATTRIBUTES = QgsVectorDataProvider.DeleteAttributes
+
+# Provider keys of web/cloud services. providerType() returns a short
+# interned string, which is much cheaper to test than scanning the full
+# source URI for 'url='.
+WEB_PROVIDERS: frozenset[str] = frozenset(
+    {
+        "wms",
+        "wfs",
+        "arcgisfeatureserver",
+        "arcgismapserver",
+        "vectortile",
+        "xyzvectortiles",
+    }
+)
+
+
+def is_web_service_layer(layer: QgsMapLayer) -> bool:
+    """Check whether a layer's data comes from a web service.
+
+    :param layer: The layer to check.
+    :returns: True if the layer uses a web provider or a url= source.
+    """
+    if layer.providerType() in WEB_PROVIDERS:
+        return True
+    # Fallback for web sources served through other providers (e.g. OGR).
+    return "url=" in layer.source()
+
+# Cached QgsProject.instance() result, so repeated helpers do not cross
+# the SIP boundary on every call. Invalidated when the project is cleared.
+_cached_project: QgsProject | None = None
+
+
+# Cached GeoPackage path per project file; a cache hit still verifies
+# existence with a single stat but skips the logging and creation logic.
+_gpkg_path_cache: dict[str, Path] = {}
+
+# SQLite PRAGMAs applied to freshly created GeoPackages.
+# journal_mode=WAL persists in the file, so every later write by OGR or
+# QGIS skips the default rollback-journal fsync dance; the remaining
+# PRAGMAs are cheap per-connection tuning.
+_GPKG_PRAGMAS: tuple[str, ...] = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+)
+
+
+def apply_gpkg_pragmas(gpkg_path: Path) -> None:
+    """Tune a GeoPackage's SQLite settings for faster writes.
+
+    Errors are suppressed — the PRAGMAs are an optimization, not a
+    requirement for a working GeoPackage.
+
+    :param gpkg_path: The path to the GeoPackage.
+    """
+    with contextlib.suppress(sqlite3.Error), sqlite3.connect(str(gpkg_path)) as conn:
+        for pragma in _GPKG_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+
+
+# Lazily resolved OGR GPKG driver. GetDriverByName walks GDAL's driver
+# registry on every call, and the result never changes within a session.
+_gpkg_driver: "ogr.Driver | None" = None
+
+
+def get_gpkg_driver() -> "ogr.Driver":
+    """Return the OGR GPKG driver, resolved once per session.
+
+    Returns:
+        ogr.Driver: The GPKG driver.
+    """
+    global _gpkg_driver  # noqa: PLW0603
+    if _gpkg_driver is None:
+        _gpkg_driver = ogr.GetDriverByName("GPKG")
+    return _gpkg_driver
+
+
+def create_empty_gpkg(gpkg_path: Path) -> Path:
+    """Create an empty GeoPackage and apply the write-tuning PRAGMAs.
+
+    Shared by project_gpkg and create_gpkg so the driver, CreateDataSource
+    and PRAGMA sequence lives in one place.
+
+    :param gpkg_path: The path the GeoPackage should be created at.
+    :returns: The same path, for chaining.
+    :raises CustomRuntimeError: If the GeoPackage could not be created.
+    """
+    driver = get_gpkg_driver()
+    ds = driver.CreateDataSource(str(gpkg_path))
+    if ds is None:
+        raise_runtime_error(f"Could not create GeoPackage at \n'{gpkg_path}'")
+    # close datasource to flush file
+    ds = None  # noqa: F841
+    apply_gpkg_pragmas(gpkg_path)
+    return gpkg_path
+
+
+def _clear_project_cache() -> None:
+    """Drop the cached project references (connected to QgsProject.cleared)."""
+    global _cached_project  # noqa: PLW0603
+    _cached_project = None
+    _gpkg_path_cache.clear()
 
 
 def get_current_project() -> QgsProject:
@@ -36,6 +145,10 @@ def get_current_project() -> QgsProject:
     Returns:
     QgsProject: The current QGIS project instance.
     """
+    global _cached_project  # noqa: PLW0603
+    if _cached_project is not None:
+        return _cached_project
+
     project: QgsProject | None = QgsProject.instance()
     if project is None:
         # fmt: off
@@ -43,9 +156,32 @@ def get_current_project() -> QgsProject:
         # fmt: on
         raise_runtime_error(msg)
 
+    _cached_project = project
+    project.cleared.connect(_clear_project_cache)
+
     return project
 
 
+def get_layer_tree_root() -> QgsLayerTree:
+    """Return the layer tree root of the current project.
+
+    Centralizes the project and layer-tree validation so every entry
+    point crosses the QGIS binding in one place.
+
+    Returns:
+        QgsLayerTree: The root of the current project's layer tree.
+    """
+    project: QgsProject = get_current_project()
+    root: QgsLayerTree | None = project.layerTreeRoot()
+    if root is None:
+        # fmt: off
+        msg: str = QCoreApplication.translate("RuntimeError", "No Layer Tree is available.")
+        # fmt: on
+        raise_runtime_error(msg)
+
+    return root
+
+
 def get_path_to_project_file() -> Path:
     r"""Get the file path of the current QGIS project.
 
@@ -74,76 +210,144 @@ def project_gpkg() -> Path:
     """
 
     project_file: Path = get_path_to_project_file()
+    cache_key: str = str(project_file)
+
+    cached_path: Path | None = _gpkg_path_cache.get(cache_key)
+    if cached_path is not None and cached_path.exists():
+        return cached_path
+
     gpkg_path: Path = project_file.with_suffix(".gpkg")
 
     if gpkg_path.exists():
         log_debug(f"Project GeoPackage found in \n'{gpkg_path}'")
+        _gpkg_path_cache[cache_key] = gpkg_path
         return gpkg_path
 
     log_debug(
         f"Project GeoPackage does not exist yet. Creating empty GeoPackage \n'{gpkg_path}'..."
     )
 
-    driver = ogr.GetDriverByName("GPKG")
-    ds = driver.CreateDataSource(str(gpkg_path))
-    if ds is None:
-        raise_runtime_error(f"Could not create GeoPackage at \n'{gpkg_path}'")
-    # close datasource to flush file
-    ds = None
+    create_empty_gpkg(gpkg_path)
+    _gpkg_path_cache[cache_key] = gpkg_path
     return gpkg_path
 
 
+# Cached result of get_selected_layers, reused while the layer tree
+# selection is unchanged (e.g. a rename followed by a move in one click).
+# Invalidated through the selection model's selectionChanged signal.
+_selection_cache: list[QgsMapLayer] | None = None
+_selection_signal_connected: bool = False
+
+
+def _invalidate_selection_cache(*_args: object) -> None:
+    """Drop the cached selection (connected to the view's selection model)."""
+    global _selection_cache  # noqa: PLW0603
+    _selection_cache = None
+
+
+def _iter_layer_nodes(node: QgsLayerTreeNode) -> "Iterator[QgsLayerTreeNode]":
+    """Yield all layer nodes at or below a node, lazily and without recursion.
+
+    An explicit stack avoids the intermediate lists and recursive SIP
+    calls of QgsLayerTreeGroup.findLayers() on deeply nested trees.
+
+    :param node: The layer tree node to start from.
+    :returns: An iterator over the layer nodes.
+    """
+    stack: list[QgsLayerTreeNode] = [node]
+    while stack:
+        current: QgsLayerTreeNode = stack.pop()
+        if current.nodeType() == QgsLayerTreeNode.NodeGroup:
+            stack.extend(current.children())
+        else:
+            yield current
+
+
 def get_selected_layers() -> list[QgsMapLayer]:
     """Collect all layers selected in the QGIS layer tree view.
 
     :returns: A list of selected QgsMapLayer objects.
     """
+    # Error strings are translated lazily in their branches, so the happy
+    # path does not pay three Qt catalog lookups per call.
     # fmt: off
     # ruff: noqa: E501
-    no_interface:str = QCoreApplication.translate("RuntimeError", "QGIS interface not set.")
-    no_layertree:str = QCoreApplication.translate("RuntimeError", "Could not get layer tree view.")
-    no_selection:str = QCoreApplication.translate("RuntimeError", "No layers or groups selected.")
-    # fmt: on
-
+    iface = get_iface()
     if iface is None:
-        raise_runtime_error(no_interface)
+        raise_runtime_error(QCoreApplication.translate("RuntimeError", "QGIS interface not set."))
 
     layer_tree: QgsLayerTreeView | None = iface.layerTreeView()
     if not layer_tree:
-        raise_runtime_error(no_layertree)
+        raise_runtime_error(QCoreApplication.translate("RuntimeError", "Could not get layer tree view."))
+    # fmt: on
+
+    global _selection_cache, _selection_signal_connected  # noqa: PLW0603
+    if _selection_cache is not None:
+        return list(_selection_cache)
 
-    selected_layers: set[QgsMapLayer] = set()
+    # Deduplicate via the cheap layer.id() string instead of hashing the
+    # SIP-wrapped layer objects themselves.
+    selected_layers: dict[str, QgsMapLayer] = {}
     selected_nodes: list[QgsLayerTreeNode] = layer_tree.selectedNodes()
     if not selected_nodes:
-        raise_user_error(no_selection)
+        # fmt: off
+        raise_user_error(QCoreApplication.translate("RuntimeError", "No layers or groups selected."))
+        # fmt: on
 
     for node in selected_nodes:
-        if isinstance(node, QgsLayerTreeGroup):
-            # If a group is selected, add all its layers that are not empty recursively.
-            for layer_node in node.findLayers():
-                if layer := layer_node.layer():
-                    selected_layers.add(layer)
-        elif isinstance(node, QgsLayerTreeLayer) and node.layer():
+        # nodeType() is a plain enum compare; isinstance() on SIP-wrapped
+        # classes is considerably more expensive.
+        node_type = node.nodeType()
+        if node_type == QgsLayerTreeNode.NodeGroup:
+            # If a group is selected, add all its layers recursively.
+            # dict.update() iterates at C level instead of one insert per layer.
+            selected_layers.update(
+                (layer.id(), layer)
+                for layer_node in _iter_layer_nodes(node)
+                if (layer := layer_node.layer())  # pyright: ignore[reportAttributeAccessIssue]
+            )
+        elif node_type == QgsLayerTreeNode.NodeLayer and (
+            node_layer := node.layer()  # pyright: ignore[reportAttributeAccessIssue]
+        ):
             # Add the single selected layer.
-            selected_layers.add(node.layer())
+            selected_layers.setdefault(node_layer.id(), node_layer)
         else:
             log_debug(f"Unexpected node type in selection: {type(node)}")
 
     # Sort the selected layers based on their order in the layer tree (Top to Bottom)
-    project = QgsProject.instance()
-    if project and (root := project.layerTreeRoot()):
-        layer_order = root.layerOrder()
-        # Create a mapping of layer ID to index for O(1) lookup
-        order_map = {layer.id(): i for i, layer in enumerate(layer_order)}
-
-        # Sort selected layers based on their index in the layer order
-        # Layers not in the layer order (shouldn't happen for valid layers) will be at the end
-        return sorted(
-            selected_layers,
-            key=lambda layer: order_map.get(layer.id(), float("inf")),
-        )
-
-    return list(selected_layers)
+    # A single layer needs no ordering, so skip the layerOrder() call and
+    # the order map entirely for the most common selection size.
+    result: list[QgsMapLayer] = list(selected_layers.values())
+    if (
+        len(result) > 1
+        and (project := QgsProject.instance())
+        and (root := project.layerTreeRoot())
+    ):
+        # layerOrder() already defines the target order, so one filtering
+        # pass over it yields the sorted selection without any comparisons
+        # and with a single id() call per layer.
+        remaining: dict[str, QgsMapLayer] = dict(selected_layers)
+        ordered: list[QgsMapLayer] = [
+            layer
+            for order_layer in root.layerOrder()
+            if (layer := remaining.pop(order_layer.id(), None)) is not None
+        ]
+        # Layers not in the layer order (shouldn't happen for valid layers)
+        # keep their traversal position at the end.
+        ordered.extend(remaining.values())
+        result = ordered
+
+    # Only cache once invalidation is wired up, otherwise a stale
+    # selection could be served indefinitely.
+    if not _selection_signal_connected and (
+        selection_model := layer_tree.selectionModel()
+    ):
+        selection_model.selectionChanged.connect(_invalidate_selection_cache)
+        _selection_signal_connected = True
+    if _selection_signal_connected:
+        _selection_cache = result
+
+    return list(result)
 
 
 def clear_attribute_table(layer: QgsMapLayer) -> None:
@@ -151,8 +355,9 @@ def clear_attribute_table(layer: QgsMapLayer) -> None:
 
     :param layer: The layer whose attribute table should be cleared.
     """
-    if not isinstance(layer, QgsVectorLayer):
-        # This function only applies to vector layers.
+    # This function only applies to vector layers. layer.type() is a
+    # plain enum compare, cheaper than isinstance on a SIP-wrapped class.
+    if layer.type() != QgsMapLayer.VectorLayer:
         return
 
     provider: QgsDataProvider | None = layer.dataProvider()
@@ -160,9 +365,10 @@ def clear_attribute_table(layer: QgsMapLayer) -> None:
         return
 
     # Check if the provider supports deleting attributes.
-    if not provider.capabilities() & QgsVectorDataProvider.DeleteAttributes:
+    if not provider.capabilities() & _DELETE_ATTRIBUTES:
         return
 
-    if field_indices := list(range(layer.fields().count())):
-        provider.deleteAttributes(field_indices)
+    field_count: int = layer.fields().count()  # pyright: ignore[reportAttributeAccessIssue]
+    if field_count:
+        provider.deleteAttributes(list(range(field_count)))
         layer.updateFields()
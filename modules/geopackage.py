@@ -9,7 +9,7 @@ import sqlite3
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from osgeo import ogr
+from osgeo import gdal, ogr
 from qgis.core import (
     Qgis,
     QgsLayerTree,
@@ -24,12 +24,14 @@ from qgis.core import (
     QgsWkbTypes,
 )
 from qgis.PyQt.QtCore import QCoreApplication
+from qgis.PyQt.QtXml import QDomDocument
 
 from .constants import GEOMETRY_SUFFIX_MAP, LAYER_TYPES
 from .general import (
-    clear_attribute_table,
+    create_empty_gpkg,
     get_current_project,
     get_selected_layers,
+    is_web_service_layer,
     project_gpkg,
 )
 from .logs_and_errors import (
@@ -37,10 +39,113 @@ from .logs_and_errors import (
     log_summary_message,
     raise_runtime_error,
 )
+from .main_interface import get_iface
 from .rename import geometry_type_suffix
 
 if TYPE_CHECKING:
-    from qgis.core import QgsMapLayerStyle, QgsMapLayerStyleManager
+    from collections.abc import Iterator
+
+    from qgis.core import QgsCoordinateTransformContext
+
+# Maps the geometry_type_name values stored in gpkg_geometry_columns to
+# QGIS geometry types, so an existing layer's type can be read straight
+# from the GeoPackage metadata without opening the layer.
+_GPKG_GEOMETRY_TYPES: dict[str, Qgis.GeometryType] = {
+    "POINT": QgsWkbTypes.PointGeometry,
+    "MULTIPOINT": QgsWkbTypes.PointGeometry,
+    "LINESTRING": QgsWkbTypes.LineGeometry,
+    "MULTILINESTRING": QgsWkbTypes.LineGeometry,
+    "CIRCULARSTRING": QgsWkbTypes.LineGeometry,
+    "COMPOUNDCURVE": QgsWkbTypes.LineGeometry,
+    "MULTICURVE": QgsWkbTypes.LineGeometry,
+    "POLYGON": QgsWkbTypes.PolygonGeometry,
+    "MULTIPOLYGON": QgsWkbTypes.PolygonGeometry,
+    "CURVEPOLYGON": QgsWkbTypes.PolygonGeometry,
+    "MULTISURFACE": QgsWkbTypes.PolygonGeometry,
+}
+
+# Matches AutoCAD (DXF/DWG) subset sources in one case-insensitive
+# automaton pass, replacing three substring scans over a lowercased
+# copy of the URI. The lookaheads keep the original any-order semantics.
+_AUTOCAD_RE: re.Pattern[str] = re.compile(
+    r"(?=.*\|subset=layer)(?=.* and space=)(?=.* and block=)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Extracts the table name from an OGR GeoPackage URI
+# (e.g. '/path/project.gpkg|layername=streets').
+_LAYERNAME_RE: re.Pattern[str] = re.compile(r"\|layername=([^|]+)")
+
+# Strips a trailing geometry suffix (e.g. ' - pt') from a layer name.
+# Compiled once at import instead of per check_existing_layer call.
+_SUFFIX_RE: re.Pattern[str] = re.compile(
+    rf"\s-\s({'|'.join([*GEOMETRY_SUFFIX_MAP.values(), 'pl'])})$"
+)
+
+# GDAL config options relaxing SQLite durability while a batch of
+# GeoPackage writes is running. Each QgsVectorFileWriter call opens its
+# own connection and would otherwise fsync per layer.
+_WRITE_SESSION_OPTIONS: dict[str, str] = {
+    "OGR_SQLITE_SYNCHRONOUS": "OFF",
+    "OGR_SQLITE_JOURNAL": "MEMORY",
+    # Page cache in MB; the SQLite default is far too small for bulk loads.
+    "OGR_SQLITE_CACHE": "512",
+}
+
+
+# Creation-option profiles per band data type. GDAL's GPKG default tile
+# format is PNG_JPEG, which silently writes lossy JPEG for fully opaque
+# 8-bit tiles; Byte rasters are pinned to lossless PNG instead. Non-Byte
+# rasters (int16/float DEMs) are stored through GDAL's gridded-coverage
+# extension, which encodes its own tiles and takes no TILE_FORMAT.
+_RASTER_PROFILES: dict[str, dict[str, str]] = {
+    "byte": {"TILE_FORMAT": "PNG", "ZLEVEL": "6"},
+    "other": {},
+}
+
+# Overview (pyramid) downsampling factors built for rasters written to
+# the GeoPackage; GDAL skips levels smaller than one tile.
+_OVERVIEW_LEVELS: list[int] = [2, 4, 8, 16, 32, 64, 128, 256]
+
+# GDAL config applied while a raster is re-encoded into the GeoPackage:
+# a block cache large enough for tile re-encoding (in MB) and
+# multi-threaded tile compression.
+_RASTER_WRITE_OPTIONS: dict[str, str] = {
+    "GDAL_CACHEMAX": "512",
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+}
+
+
+@contextlib.contextmanager
+def _gdal_config(options: dict[str, str]) -> "Iterator[None]":
+    """Temporarily apply GDAL config options, restoring previous values.
+
+    :param options: The config options to set for the duration.
+    """
+    previous: dict[str, str | None] = {
+        option: gdal.GetConfigOption(option) for option in options
+    }
+    for option, value in options.items():
+        gdal.SetConfigOption(option, value)
+    try:
+        yield
+    finally:
+        for option, value in previous.items():
+            gdal.SetConfigOption(option, value)
+
+
+@contextlib.contextmanager
+def _gpkg_write_session() -> "Iterator[None]":
+    """Relax SQLite journaling for the duration of a batch of GPKG writes.
+
+    QgsVectorFileWriter opens its own connection per layer, so a single
+    wrapping transaction is not possible. Instead, the OGR SQLite config
+    options are relaxed so each write skips its journal flush — the cost
+    that dominates multi-layer moves. Previous values are restored when
+    the batch finishes.
+    """
+    with _gdal_config(_WRITE_SESSION_OPTIONS):
+        yield
 
 
 def create_gpkg(
@@ -61,17 +166,84 @@ def create_gpkg(
 
     log_debug(f"Creating empty GeoPackage \n'{gpkg_path}'...")
 
-    driver = ogr.GetDriverByName("GPKG")
-    ds = driver.CreateDataSource(str(gpkg_path))
-    if ds is None:
-        raise_runtime_error(f"Could not create GeoPackage at \n'{gpkg_path}'")
-    # close datasource to flush file
-    ds = None
+    return create_empty_gpkg(gpkg_path)
+
+
+def _is_autocad_import(layer: QgsMapLayer) -> bool:
+    """Check whether a layer originates from an AutoCAD (DXF/DWG) import.
+
+    :param layer: The layer to check.
+    :returns: True if the layer's source matches the AutoCAD subset pattern.
+    """
+    return bool(_AUTOCAD_RE.match(layer.source()))
+
+
+def _gpkg_catalog_connection(gpkg_path: Path) -> sqlite3.Connection:
+    """Open a read-only sqlite connection to a GeoPackage's catalog.
 
-    return gpkg_path
+    mode=ro never takes a write lock and creates no WAL side files, so
+    catalog probes cannot contend with a writer holding the database.
 
+    :param gpkg_path: The path to the GeoPackage.
+    :returns: The read-only sqlite connection.
+    """
+    return sqlite3.connect(f"file:{gpkg_path}?mode=ro", uri=True)
+
+
+def _existing_gpkg_tables(gpkg_path: Path) -> set[str]:
+    """Fetch all table names of a GeoPackage in a single sqlite query.
 
-def check_existing_layer(gpkg_path: Path, layer: QgsMapLayer) -> str:
+    sqlite3 is used directly to avoid QGIS warnings about missing layers
+    and OGR errors on empty GeoPackages.
+
+    :param gpkg_path: The path to the GeoPackage.
+    :returns: The set of table names (empty if the file is unreadable).
+    """
+    tables: set[str] = set()
+    with (
+        contextlib.suppress(sqlite3.Error),
+        _gpkg_catalog_connection(gpkg_path) as conn,
+    ):
+        cursor: sqlite3.Cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = {row[0] for row in cursor.fetchall()}
+    return tables
+
+
+def _gpkg_layer_index(gpkg_path: Path) -> dict[str, Qgis.GeometryType | None]:
+    """Index a GeoPackage's tables and geometry types in one sqlite query.
+
+    Replaces a per-layer existence query plus a per-collision geometry
+    query with a single catalog read for the whole batch.
+
+    :param gpkg_path: The path to the GeoPackage.
+    :returns: A mapping of table name to geometry type (None for
+        non-spatial tables and unmapped types); empty if the file is
+        unreadable.
+    """
+    index: dict[str, Qgis.GeometryType | None] = {}
+    with (
+        contextlib.suppress(sqlite3.Error),
+        _gpkg_catalog_connection(gpkg_path) as conn,
+    ):
+        cursor: sqlite3.Cursor = conn.cursor()
+        cursor.execute(
+            "SELECT m.name, g.geometry_type_name FROM sqlite_master m "
+            "LEFT JOIN gpkg_geometry_columns g ON g.table_name = m.name "
+            "WHERE m.type = 'table'"
+        )
+        index = {
+            row[0]: _GPKG_GEOMETRY_TYPES.get(str(row[1]).upper()) if row[1] else None
+            for row in cursor.fetchall()
+        }
+    return index
+
+
+def check_existing_layer(
+    gpkg_path: Path,
+    layer: QgsMapLayer,
+    layer_index: dict[str, Qgis.GeometryType | None] | None = None,
+) -> str:
     """Check if a layer with the same name and geometry type exists in the GeoPackage.
 
     If a layer with the same name but different geometry type exists, a new
@@ -81,6 +253,9 @@ def check_existing_layer(gpkg_path: Path, layer: QgsMapLayer) -> str:
 
     :param gpkg_path: The path to the GeoPackage.
     :param layer: The layer to check for existence.
+    :param layer_index: Optional precomputed table/geometry index from
+        _gpkg_layer_index, so batch callers probe the file once instead
+        of once per layer.
     :returns: A layer name for the GeoPackage. This will be the original name
               if no layer with that name exists, or if a layer with the same
               name and geometry type exists (allowing overwrite). It will be a
@@ -92,32 +267,32 @@ def check_existing_layer(gpkg_path: Path, layer: QgsMapLayer) -> str:
 
     layer_name: str = layer.name()
 
-    # Check if the layer exists in the GeoPackage using sqlite3 directly
-    # to avoid QGIS warnings about missing layers and OGR errors on empty GPKGs.
-    layer_exists = False
-    with contextlib.suppress(sqlite3.Error), sqlite3.connect(str(gpkg_path)) as conn:
-        cursor: sqlite3.Cursor = conn.cursor()
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (layer_name,),
-        )
-        if cursor.fetchone():
-            layer_exists = True
-    if not layer_exists:
+    # A layer whose source already points into this GeoPackage would only
+    # be rewritten onto itself — return its stored table name directly
+    # instead of probing for a collision with it.
+    layer_source: str = layer.source()
+    if str(gpkg_path) in layer_source and (
+        source_match := _LAYERNAME_RE.search(layer_source)
+    ):
+        return source_match[1]
+
+    if layer_index is None:
+        layer_index = _gpkg_layer_index(gpkg_path)
+    if layer_name not in layer_index:
         # Layer does not exist, safe to use original name.
         return layer_name
 
-    uri: str = f"{gpkg_path}|layername={layer_name}"
-    gpkg_layer = QgsVectorLayer(uri, layer_name, "ogr")
-
-    if not gpkg_layer.isValid():
-        return layer_name
-
     # A layer with the same name exists. Check geometry types.
+    existing_geom_type: Qgis.GeometryType | None = layer_index[layer_name]
+    if existing_geom_type is None:
+        # Metadata is missing or unmapped — fall back to opening the layer.
+        uri: str = f"{gpkg_path}|layername={layer_name}"
+        gpkg_layer = QgsVectorLayer(uri, layer_name, "ogr")
+        if not gpkg_layer.isValid():
+            return layer_name
+        existing_geom_type = QgsWkbTypes.geometryType(gpkg_layer.wkbType())
+
     incoming_geom_type: Qgis.GeometryType = QgsWkbTypes.geometryType(layer.wkbType())
-    existing_geom_type: Qgis.GeometryType = QgsWkbTypes.geometryType(
-        gpkg_layer.wkbType()
-    )
 
     if incoming_geom_type == existing_geom_type:
         # Name and geometry match, so we can overwrite. Return original name.
@@ -126,40 +301,81 @@ def check_existing_layer(gpkg_path: Path, layer: QgsMapLayer) -> str:
     # Name matches but geometry is different. Create a new name with a suffix.
     # First, strip any existing geometry suffix from the layer name to get a
     # base name to prevent creating names with double suffixes (e.g., 'layer-pt-pt').
-    suffix_values: str = "|".join([*list(GEOMETRY_SUFFIX_MAP.values()), "pl"])
-    suffix_pattern: str = rf"\s-\s({suffix_values})$"
-    base_name: str = re.sub(suffix_pattern, "", layer_name)
+    base_name: str = _SUFFIX_RE.sub("", layer_name)
 
     return f"{base_name}{geometry_type_suffix(layer)}"
 
 
+def _vector_save_options() -> QgsVectorFileWriter.SaveVectorOptions:
+    """Create the writer options shared by every vector write of a batch.
+
+    :returns: Options with the per-batch fields set; layerName and
+        skipAttributeCreation are mutated per layer by the writer helper.
+    """
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+    # Do not grow the rtree row-by-row while writing; the index is built
+    # in one pass per table after the batch (see _create_spatial_indexes).
+    options.layerOptions = ["SPATIAL_INDEX=NO"]
+    return options
+
+
 def add_vector_layer_to_gpkg(
-    project: QgsProject, layer: QgsMapLayer, gpkg_path: Path
+    layer: QgsMapLayer,
+    gpkg_path_str: str,
+    layer_name: str,
+    transform_context: "QgsCoordinateTransformContext",
+    options: QgsVectorFileWriter.SaveVectorOptions | None = None,
 ) -> tuple:
     """Add a vector layer to the GeoPackage.
 
     :param layer: The layer to add.
-    :param gpkg_path: The path to the GeoPackage.
+    :param gpkg_path_str: The path to the GeoPackage, already stringified
+        by the caller.
+    :param layer_name: The collision-free target name resolved by
+        check_existing_layer.
+    :param transform_context: The project's transform context, fetched
+        once per batch by the caller.
+    :param options: Optional writer options reused across a batch; built
+        fresh when not supplied. Only the per-layer fields are mutated.
     """
 
-    options = QgsVectorFileWriter.SaveVectorOptions()
-    options.driverName = "GPKG"
-    options.layerName = check_existing_layer(gpkg_path, layer)
-    options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+    if options is None:
+        options = _vector_save_options()
+    options.layerName = layer_name
+
+    # AutoCAD attribute tables are not wanted in the GeoPackage. Not
+    # writing them is much cheaper than writing them and deleting the
+    # fields from the written layer afterwards.
+    options.skipAttributeCreation = _is_autocad_import(layer)
+    if options.skipAttributeCreation:
+        log_debug(
+            f"AutoCAD import detected for layer '{layer.name()}'. "
+            "Writing without attributes."
+        )
 
     return QgsVectorFileWriter.writeAsVectorFormatV3(
-        layer, str(gpkg_path), project.transformContext(), options
+        layer, gpkg_path_str, transform_context, options
     )
 
 
 def add_raster_layer_to_gpkg(
-    project: QgsProject, layer: QgsMapLayer, gpkg_path: Path
+    layer: QgsMapLayer,
+    gpkg_path_str: str,
+    layer_name: str,
+    transform_context: "QgsCoordinateTransformContext",
 ) -> dict[str, str | None]:
     """Add a raster layer to the GeoPackage using QgsRasterFileWriter.
 
     Args:
         layer: The layer to add.
-        gpkg_path: The path to the GeoPackage.
+        gpkg_path_str: The path to the GeoPackage, already stringified by
+            the caller.
+        layer_name: The collision-free target name resolved by
+            check_existing_layer.
+        transform_context: The project's transform context, fetched once
+            per batch by the caller.
 
     Returns:
         A dictionary with the result. The 'error' key will be None on
@@ -173,9 +389,7 @@ def add_raster_layer_to_gpkg(
     if not provider:
         return {"error": "Could not get raster data provider.", "OUTPUT": None}
 
-    layer_name: str = check_existing_layer(gpkg_path, layer)
-
-    writer = QgsRasterFileWriter(str(gpkg_path))
+    writer = QgsRasterFileWriter(gpkg_path_str)
     writer.setOutputFormat("GPKG")
 
     options: dict[str, str] = {
@@ -183,23 +397,27 @@ def add_raster_layer_to_gpkg(
         "APPEND_SUBDATASET": "YES",
         "USE_GPKG_METADATA_TABLES": "YES",
     }
+    profile_key: str = "byte" if provider.dataType(1) == Qgis.Byte else "other"
+    options.update(_RASTER_PROFILES[profile_key])
     create_options: list[str] = [f"{k}={v}" for k, v in options.items()]
     writer.setCreateOptions(create_options)
 
     pipe = QgsRasterPipe()
     pipe.set(provider.clone())
-    error: QgsRasterFileWriter.WriterError = writer.writeRaster(
-        pipe,
-        layer.width(),
-        layer.height(),
-        layer.extent(),
-        layer.crs(),
-        project.transformContext(),
-    )
+    with _gdal_config(_RASTER_WRITE_OPTIONS):
+        error: QgsRasterFileWriter.WriterError = writer.writeRaster(
+            pipe,
+            layer.width(),
+            layer.height(),
+            layer.extent(),
+            layer.crs(),
+            transform_context,
+        )
 
     if error == QgsRasterFileWriter.WriterError.NoError:
         log_debug(f"Raster Layer '{layer_name}' added to GeoPackage.")
-        return {"error": None, "OUTPUT": str(gpkg_path)}
+        _build_raster_overviews(gpkg_path_str, layer_name)
+        return {"error": None, "OUTPUT": gpkg_path_str}
 
     log_debug(
         f"Failed to add raster layer '{layer_name}' to GeoPackage. Error: {error}"
@@ -207,27 +425,59 @@ def add_raster_layer_to_gpkg(
     return {"error": error, "OUTPUT": None}
 
 
-def clear_autocad_attributes(layer: QgsMapLayer, gpkg_path: Path) -> None:
-    """Clear all AutoCAD attributes from a layer's attribute table.
+def _build_raster_overviews(gpkg_path_str: str, table_name: str) -> None:
+    """Build overview pyramids for a raster table in the GeoPackage.
+
+    Without overviews QGIS re-reads the full-resolution raster at every
+    zoom level; building them once right after the write pays off on
+    every later repaint. Failures are logged but do not fail the write.
+
+    :param gpkg_path_str: The path to the GeoPackage.
+    :param table_name: The raster table to build overviews for.
+    """
+    ds = gdal.OpenEx(f"GPKG:{gpkg_path_str}:{table_name}", gdal.GA_Update)
+    if ds is None:
+        log_debug(
+            f"Could not open raster table '{table_name}' to build overviews.",
+            Qgis.Warning,
+        )
+        return
+
+    ds.BuildOverviews("AVERAGE", _OVERVIEW_LEVELS)
+    log_debug(f"Overviews built for raster '{table_name}'.")
+    ds = None  # noqa: F841 - close dataset to flush overviews
+
+
+def _create_spatial_indexes(gpkg_path: Path, table_names: list[str]) -> None:
+    """Build the rtree spatial indexes for freshly written vector layers.
+
+    Vector layers are written with SPATIAL_INDEX=NO so the rtree is not
+    grown row-by-row during the bulk insert; one CreateSpatialIndex pass
+    per table afterwards is far cheaper. Failures are logged but do not
+    fail the batch.
 
-    :param layer: The layer to clear AutoCAD attributes from.
+    :param gpkg_path: The path to the GeoPackage.
+    :param table_names: The table names to index.
     """
+    if not table_names:
+        return
 
-    uri: str = f"{gpkg_path}|layername={layer.name()}"
-    gpkg_layer = QgsVectorLayer(uri, layer.name(), "ogr")
-    if gpkg_layer.isValid() and isinstance(layer, QgsVectorLayer):
-        is_autocad_import: bool = all(
-            s in layer.source().lower()
-            for s in ["|subset=layer", " and space=", " and block="]
+    ds = ogr.Open(str(gpkg_path), update=1)
+    if ds is None:
+        log_debug(
+            f"Could not open '{gpkg_path}' to build spatial indexes.", Qgis.Warning
         )
-        if is_autocad_import:
-            log_debug(
-                f"AutoCAD import detected for layer '{layer.name()}'. "
-                "Clearing attribute table."
-            )
-            clear_attribute_table(gpkg_layer)
-    else:
-        log_debug(f"Could not reload layer '{layer.name()}' from GeoPackage.")
+        return
+
+    for table in table_names:
+        ogr_layer = ds.GetLayerByName(table)
+        if ogr_layer is None:
+            continue
+        geom_column: str = ogr_layer.GetGeometryColumn() or "geom"
+        ds.ExecuteSQL(f'SELECT CreateSpatialIndex("{table}", "{geom_column}")')
+        log_debug(f"Spatial index created for '{table}'.")
+
+    ds = None  # noqa: F841 - close datasource to flush file
 
 
 def add_layers_to_gpkg(
@@ -245,6 +495,8 @@ def add_layers_to_gpkg(
     """
 
     project: QgsProject = get_current_project()
+    # One SIP call for the whole batch instead of one per written layer.
+    transform_context: "QgsCoordinateTransformContext" = project.transformContext()
     if gpkg_path is None:
         gpkg_path = project_gpkg()
 
@@ -254,52 +506,85 @@ def add_layers_to_gpkg(
     results: dict = {"successes": 0, "failures": [], "layer_mapping": {}}
     if layers is None:
         layers = get_selected_layers()
-    for layer in layers:
-        if "url=" in layer.source():
-            log_debug(f"Layer '{layer.name()}' is a web service. Skipping.")
-            results["successes"] += 1
-            results["layer_mapping"][layer] = layer.name()
-            continue
 
-        layer_name: str = check_existing_layer(gpkg_path, layer)
+    # Stringified once for the whole batch; the writer helpers only need
+    # the string form.
+    gpkg_path_str: str = str(gpkg_path)
 
-        log_debug(
-            f"Adding layer '{layer.name()}' (layer_name: '{layer_name}') "
-            f"of type {LAYER_TYPES.get(layer.type(), layer.type())}' "
-            f"to GeoPackage '{gpkg_path.name}'..."
-        )
+    # Probe the GeoPackage's catalog once for the whole batch; the index
+    # is kept up to date as layers are written so name collisions within
+    # one batch are still detected.
+    layer_index: dict[str, Qgis.GeometryType | None] = _gpkg_layer_index(gpkg_path)
 
-        if isinstance(layer, QgsVectorLayer):
-            error: tuple = add_vector_layer_to_gpkg(project, layer, gpkg_path)
-            if error[0] == QgsVectorFileWriter.WriterError.NoError:
-                results["successes"] += 1
-                results["layer_mapping"][layer] = layer_name
-                clear_autocad_attributes(layer, gpkg_path)
-                log_debug(
-                    f"Layer '{layer.name()}' added to "
-                    f"GeoPackage '{gpkg_path.name}' successfully."
-                )
-            else:
-                results["failures"].append((layer.name(), error[1]))
-                log_debug(f"Failed to add layer '{layer.name()}': {error[1]}")
+    # Vector tables written in this batch; their spatial indexes are
+    # built in one pass after the loop.
+    written_vector_tables: list[str] = []
 
-        elif isinstance(layer, QgsMapLayer) and layer.type() == QgsMapLayer.RasterLayer:
-            raster_results: dict = add_raster_layer_to_gpkg(project, layer, gpkg_path)
-            if raster_results["OUTPUT"]:
+    # One options object for the whole batch; only the per-layer fields
+    # are mutated inside add_vector_layer_to_gpkg.
+    save_options: QgsVectorFileWriter.SaveVectorOptions = _vector_save_options()
+
+    with _gpkg_write_session():
+        for layer in layers:
+            if is_web_service_layer(layer):
+                log_debug(f"Layer '{layer.name()}' is a web service. Skipping.")
                 results["successes"] += 1
-                results["layer_mapping"][layer] = layer_name
-                log_debug(
-                    f"Layer '{layer.name()}' added to "
-                    f"GeoPackage '{gpkg_path.name}' successfully."
+                results["layer_mapping"][layer] = layer.name()
+                continue
+
+            layer_name: str = check_existing_layer(gpkg_path, layer, layer_index)
+
+            log_debug(
+                f"Adding layer '{layer.name()}' (layer_name: '{layer_name}') "
+                f"of type {LAYER_TYPES.get(layer.type(), layer.type())}' "
+                f"to GeoPackage '{gpkg_path.name}'..."
+            )
+
+            if isinstance(layer, QgsVectorLayer):
+                error: tuple = add_vector_layer_to_gpkg(
+                    layer, gpkg_path_str, layer_name, transform_context, save_options
+                )
+                if error[0] == QgsVectorFileWriter.WriterError.NoError:
+                    results["successes"] += 1
+                    results["layer_mapping"][layer] = layer_name
+                    layer_index[layer_name] = QgsWkbTypes.geometryType(layer.wkbType())
+                    written_vector_tables.append(layer_name)
+                    log_debug(
+                        f"Layer '{layer.name()}' added to "
+                        f"GeoPackage '{gpkg_path.name}' successfully."
+                    )
+                else:
+                    results["failures"].append((layer.name(), error[1]))
+                    log_debug(f"Failed to add layer '{layer.name()}': {error[1]}")
+
+            elif (
+                isinstance(layer, QgsMapLayer)
+                and layer.type() == QgsMapLayer.RasterLayer
+            ):
+                raster_results: dict = add_raster_layer_to_gpkg(
+                    layer, gpkg_path_str, layer_name, transform_context
                 )
+                if raster_results["OUTPUT"]:
+                    results["successes"] += 1
+                    results["layer_mapping"][layer] = layer_name
+                    layer_index[layer_name] = None
+                    log_debug(
+                        f"Layer '{layer.name()}' added to "
+                        f"GeoPackage '{gpkg_path.name}' successfully."
+                    )
+                else:
+                    results["failures"].append((layer.name(), raster_results["error"]))
+                    log_debug(
+                        f"Failed to add layer '{layer.name()}': "
+                        f"{raster_results['error']}"
+                    )
             else:
-                results["failures"].append((layer.name(), raster_results["error"]))
+                results["failures"].append((layer.name(), "Unsupported layer type."))
                 log_debug(
-                    f"Failed to add layer '{layer.name()}': {raster_results['error']}"
+                    f"Failed to add layer '{layer.name()}': Unsupported layer type."
                 )
-        else:
-            results["failures"].append((layer.name(), "Unsupported layer type."))
-            log_debug(f"Failed to add layer '{layer.name()}': Unsupported layer type.")
+
+    _create_spatial_indexes(gpkg_path, written_vector_tables)
 
     log_summary_message(
         successes=results["successes"],
@@ -310,41 +595,31 @@ def add_layers_to_gpkg(
     return results
 
 
-def copy_layer_style(source_layer: QgsMapLayer, target_layer: QgsMapLayer) -> None:
+def copy_layer_style(
+    source_layer: QgsMapLayer, target_layer: QgsMapLayer, *, emit: bool = True
+) -> None:
     """Copy the active style from a source layer to a target layer.
 
-    This function retrieves the currently active style from the `source_layer`,
-    adds it to the `target_layer`'s style manager under the name
-    'copied_style', and then sets this new style as the current one for the
-    target layer. Finally, it triggers a repaint to ensure the changes are
-    visible in the QGIS interface.
+    The style is serialized to XML once and imported on the target — a
+    single round-trip instead of the two QgsMapLayerStyle deep copies a
+    style-manager based copy performs.
 
     Args:
         source_layer: The QGIS layer from which to copy the style.
         target_layer: The QGIS layer to which the style will be applied.
+        emit: Whether to trigger the repaint and style-changed signal
+            immediately. Batch callers pass False and fire one repaint
+            pass after the whole batch.
     """
 
-    mngr_source: QgsMapLayerStyleManager | None = source_layer.styleManager()
-    mngr_target: QgsMapLayerStyleManager | None = target_layer.styleManager()
-
-    if mngr_source is None or mngr_target is None:
-        return
-
-    # get the name of the source layer's current style
-    style_name: str = mngr_source.currentStyle()
+    doc = QDomDocument()
+    source_layer.exportNamedStyle(doc)
+    target_layer.importNamedStyle(doc)
 
-    # get the style by the name
-    style: QgsMapLayerStyle = mngr_source.style(style_name)
-
-    # add the style to the target layer with a custom name (in this case: 'copied')
-    mngr_target.addStyle("copied_style", style)
-
-    # set the added style as the current style
-    mngr_target.setCurrentStyle("copied_style")
-
-    # propogate the changes to the QGIS GUI
-    target_layer.triggerRepaint()
-    target_layer.emitStyleChanged()
+    if emit:
+        # propogate the changes to the QGIS GUI
+        target_layer.triggerRepaint()
+        target_layer.emitStyleChanged()
 
 
 def _initialize_parameters(
@@ -372,7 +647,7 @@ def _initialize_parameters(
 
 
 def _handle_web_service_layer(
-    layer_to_find: QgsMapLayer, layer_name: str, project: QgsProject
+    layer_to_find: QgsMapLayer, layer_name: str, existing_index: set[tuple[str, str]]
 ) -> QgsMapLayer | None:
     """Handle cloning and adding a web service layer.
 
@@ -381,18 +656,13 @@ def _handle_web_service_layer(
     Args:
         layer_to_find: The original web service layer.
         layer_name: The target name for the new layer.
-        project: The current QGIS project.
+        existing_index: Set of (source, name) tuples of the layers already
+            in the project, built once per batch.
 
     Returns:
         A cloned QgsMapLayer, or None if it already exists.
     """
-    layer_exists: bool = any(
-        existing_layer.source() == layer_to_find.source()
-        and existing_layer.name() == layer_name
-        for existing_layer in project.mapLayers().values()
-    )
-
-    if layer_exists:
+    if (layer_to_find.source(), layer_name) in existing_index:
         log_debug(
             f"Web service layer '{layer_name}' with the same source "
             "already exists. Skipping.",
@@ -403,6 +673,9 @@ def _handle_web_service_layer(
     gpkg_layer: QgsMapLayer | None = layer_to_find.clone()
     if gpkg_layer:
         gpkg_layer.setName(layer_name)
+        # Register the clone so a duplicate selection in the same batch
+        # is skipped instead of cloned again.
+        existing_index.add((gpkg_layer.source(), layer_name))
         log_debug(f"Web service layer '{layer_name}' cloned.")
     return gpkg_layer
 
@@ -411,7 +684,7 @@ def _create_layer_from_source(
     layer_to_find: QgsMapLayer,
     layer_name: str,
     gpkg_path_str: str,
-    project: QgsProject,
+    existing_index: set[tuple[str, str]],
 ) -> tuple[QgsMapLayer | None, str]:
     """Create a QgsMapLayer from its source (GPKG or web service).
 
@@ -419,14 +692,18 @@ def _create_layer_from_source(
         layer_to_find: The original layer to be loaded.
         layer_name: The name of the layer in the GeoPackage or for the clone.
         gpkg_path_str: The string representation of the GeoPackage path.
-        project: The current QGIS project.
+        existing_index: Set of (source, name) tuples of the layers already
+            in the project.
 
     Returns:
         A tuple containing the new QgsMapLayer (or None) and its URI string.
     """
     uri = ""
-    if "url=" in layer_to_find.source():
-        return _handle_web_service_layer(layer_to_find, layer_name, project), uri
+    if is_web_service_layer(layer_to_find):
+        return (
+            _handle_web_service_layer(layer_to_find, layer_name, existing_index),
+            uri,
+        )
 
     if isinstance(layer_to_find, QgsRasterLayer):
         uri = f"GPKG:{gpkg_path_str}:{layer_name}"
@@ -463,6 +740,23 @@ def add_layers_from_gpkg_to_project(
     not_found_layers: list[str] = []
     gpkg_path_str = str(gpkg_path)
 
+    # Collect valid layers first and register them in one addMapLayers
+    # call, so the project emits one layersAdded signal for the whole
+    # batch instead of one per layer.
+    to_add: list[QgsMapLayer] = []
+    style_pairs: list[tuple[QgsMapLayer, QgsMapLayer]] = []
+
+    # Index the project's layers once; scanning all mapLayers() per
+    # selected layer would be O(selected × project layers).
+    existing_index: set[tuple[str, str]] = {
+        (existing.source(), existing.name())
+        for existing in project.mapLayers().values()
+    }
+
+    # One sqlite query instead of one OGR open per layer just to find
+    # out whether the table exists at all.
+    gpkg_tables: set[str] = _existing_gpkg_tables(gpkg_path)
+
     for layer_to_find in layers:
         layer_name = (
             layer_mapping.get(layer_to_find, layer_to_find.name())
@@ -470,8 +764,16 @@ def add_layers_from_gpkg_to_project(
             else layer_to_find.name()
         )
 
+        if (
+            layer_name not in gpkg_tables
+            and not is_web_service_layer(layer_to_find)
+        ):
+            not_found_layers.append(layer_name)
+            log_debug(f"Layer '{layer_name}' not found in GeoPackage.", Qgis.Warning)
+            continue
+
         gpkg_layer, uri = _create_layer_from_source(
-            layer_to_find, layer_name, gpkg_path_str, project
+            layer_to_find, layer_name, gpkg_path_str, existing_index
         )
 
         if not gpkg_layer:
@@ -486,13 +788,37 @@ def add_layers_from_gpkg_to_project(
             log_debug(msg, Qgis.Warning)
             continue
 
-        project.addMapLayer(gpkg_layer, addToLegend=False)
-        root.insertLayer(0, gpkg_layer)
+        to_add.append(gpkg_layer)
         added_layers.append(layer_name)
 
         # Cloned web layers already have their style.
-        if "url=" not in layer_to_find.source():
-            copy_layer_style(layer_to_find, gpkg_layer)
+        if not is_web_service_layer(layer_to_find):
+            style_pairs.append((layer_to_find, gpkg_layer))
+
+    if to_add:
+        # Blocking the project's or layer tree's signals outright would
+        # desync the legend model, so pause canvas rendering instead: the
+        # canvas redraws once when the flag is restored rather than per
+        # inserted layer.
+        iface = get_iface()
+        canvas = iface.mapCanvas() if iface else None
+        if canvas is not None:
+            canvas.setRenderFlag(False)
+        try:
+            project.addMapLayers(to_add, addToLegend=False)
+            for gpkg_layer in to_add:
+                root.insertLayer(0, gpkg_layer)
+            for source_layer, gpkg_layer in style_pairs:
+                copy_layer_style(source_layer, gpkg_layer, emit=False)
+        finally:
+            if canvas is not None:
+                canvas.setRenderFlag(True)
+
+        # One repaint pass after rendering is re-enabled, instead of one
+        # repaint and style-changed cascade per copied style.
+        for _source_layer, gpkg_layer in style_pairs:
+            gpkg_layer.triggerRepaint()
+            gpkg_layer.emitStyleChanged()
 
     if added_layers:
         log_debug(
@@ -516,5 +842,14 @@ def add_layers_from_gpkg_to_project(
 def move_layers_to_gpkg() -> None:
     """Move the selected layers to the project's GeoPackage."""
 
-    results = add_layers_to_gpkg()
-    add_layers_from_gpkg_to_project(layer_mapping=results.get("layer_mapping"))
+    # Resolve the selection and GeoPackage path once and hand them to both
+    # steps instead of letting each step re-derive them.
+    layers: list[QgsMapLayer] = get_selected_layers()
+    gpkg_path: Path = project_gpkg()
+
+    results = add_layers_to_gpkg(layers, gpkg_path)
+    add_layers_from_gpkg_to_project(
+        gpkg_path=gpkg_path,
+        layers=layers,
+        layer_mapping=results.get("layer_mapping"),
+    )
@@ -4,17 +4,68 @@ Determine the location of the layer's data source.
 """
 
 import os
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from qgis.core import QgsMapLayer, QgsProject, QgsVectorLayer
 from qgis.gui import QgisInterface, QgsLayerTreeViewIndicator
 
 from .constants import LayerLocation
-from .general import project_gpkg
+from .general import get_path_to_project_file, is_web_service_layer, project_gpkg
 from .logs_and_errors import log_debug
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Iterable
+
+    from qgis.core import QgsLayerTree
+    from qgis.gui import QgsLayerTreeView
+
+# Cache of determined locations keyed by layer id. Each entry stores the
+# (normalized) source string it was computed from, so a layer whose data
+# source changed is re-classified instead of served stale. Eviction is
+# wired to the plugin's layer-removed and project-read handlers; as a
+# safety net against sessions where those signals never fire, the cache
+# is kept as a size-capped LRU (OrderedDict keeps insertion order, and
+# hits are moved to the end so the oldest entries are evicted first).
+_LOCATION_CACHE_MAX_SIZE: int = 4096
+_location_cache: OrderedDict[str, tuple[str, LayerLocation]] = OrderedDict()
+
+
+def clear_location_cache(layer_id: str | None = None) -> None:
+    """Evict one layer (or all layers) from the location cache.
+
+    :param layer_id: The id of the layer to evict, or None to clear
+        the whole cache.
+    """
+    if layer_id is None:
+        _location_cache.clear()
+        _context_cache.clear()
+    else:
+        _location_cache.pop(layer_id, None)
+
+
+# Normalized (gpkg path, project folder) tuples keyed by the project
+# file path. A cache hit skips project_gpkg() entirely — including its
+# exists() stat — as well as the normcase/dirname string work.
+_context_cache: dict[str, tuple[str, str]] = {}
+
+
+def _location_context() -> tuple[str, str]:
+    """Return the normalized project GeoPackage path and project folder.
+
+    :returns: A tuple of (gpkg path, project folder), both normalized for
+        case-insensitive comparison against layer sources.
+    """
+    project_file: str = str(get_path_to_project_file())
+    context: tuple[str, str] | None = _context_cache.get(project_file)
+    if context is None:
+        gpkg_str: str = str(project_gpkg())
+        context = (
+            os.path.normcase(gpkg_str),
+            os.path.normcase(os.path.dirname(gpkg_str)),
+        )
+        _context_cache[project_file] = context
+    return context
 
 
 def get_layer_location(layer: QgsMapLayer) -> LayerLocation | None:
@@ -33,13 +84,56 @@ def get_layer_location(layer: QgsMapLayer) -> LayerLocation | None:
         LayerLocation | None: An enum member indicating the data source location,
         or None for memory layers.
     """
+    return _classify_layer(layer, _location_context)
+
+
+def get_layer_locations(
+    layers: "Iterable[QgsMapLayer]",
+) -> dict[str, LayerLocation | None]:
+    """Determine the data source locations of several layers at once.
+
+    The project context (GeoPackage path and project folder) is resolved
+    once for the whole batch instead of once per layer.
+
+    :param layers: The layers to classify.
+    :returns: A mapping of layer id to the determined location.
+    """
+    context: tuple[str, str] | None = None
+
+    def _batch_context() -> tuple[str, str]:
+        nonlocal context
+        if context is None:
+            context = _location_context()
+        return context
+
+    return {layer.id(): _classify_layer(layer, _batch_context) for layer in layers}
+
+
+def _classify_layer(
+    layer: QgsMapLayer, get_context: "Callable[[], tuple[str, str]]"
+) -> LayerLocation | None:
+    """Classify a single layer, resolving the project context lazily.
+
+    Empty, memory and cloud layers are recognized from the source string
+    alone; only file-based sources call get_context to compare against
+    the project GeoPackage and project folder. Non-file layers therefore
+    skip the filesystem work in _location_context entirely.
+
+    :param layer: The layer to classify.
+    :param get_context: Callable returning the normalized (gpkg path,
+        project folder) tuple.
+    :returns: An enum member indicating the data source location,
+        or None for memory layers.
+    """
     location: LayerLocation | None = None
     log_message: str = ""
 
     layer_source: str = os.path.normcase(layer.source())
-    gpkg_path: Path = project_gpkg()
-    gpkg: str = os.path.normcase(str(gpkg_path))
-    project_folder: str = os.path.normcase(str(gpkg_path.parent))
+
+    cached: tuple[str, LayerLocation] | None = _location_cache.get(layer.id())
+    if cached is not None and cached[0] == layer_source:
+        _location_cache.move_to_end(layer.id())
+        return cached[1]
 
     if isinstance(layer, QgsVectorLayer) and layer.featureCount() == 0:
         location = LayerLocation.EMPTY
@@ -48,22 +142,33 @@ def get_layer_location(layer: QgsMapLayer) -> LayerLocation | None:
         # Memory layers get an indicator from QGIS itself, so we return None.
         location = None
         log_message = "memory layer - QGIS indicator."
-    elif "url=" in layer_source:
+    elif is_web_service_layer(layer):
         location = LayerLocation.CLOUD
         log_message = "cloud data source."
-    elif gpkg in layer_source:
-        location = LayerLocation.GPKG_PROJECT
-        log_message = "in project GeoPackage. ✅"
-    elif project_folder in layer_source:
-        if ".gpkg" in layer_source:
-            location = LayerLocation.GPKG_FOLDER
-            log_message = "in a GeoPackage in the project folder."
-        else:
-            location = LayerLocation.FOLDER_NO_GPKG
-            log_message = "in the project folder, but not in a GeoPackage."
     else:
-        location = LayerLocation.EXTERNAL
-        log_message = "💥 external data source 💥"
+        gpkg, project_folder = get_context()
+        if gpkg in layer_source:
+            location = LayerLocation.GPKG_PROJECT
+            log_message = "in project GeoPackage. ✅"
+        # Require a path separator after the folder so that a sibling folder
+        # with the same prefix (e.g. 'project_data') does not match.
+        elif f"{project_folder}{os.sep}" in layer_source:
+            if ".gpkg" in layer_source:
+                location = LayerLocation.GPKG_FOLDER
+                log_message = "in a GeoPackage in the project folder."
+            else:
+                location = LayerLocation.FOLDER_NO_GPKG
+                log_message = "in the project folder, but not in a GeoPackage."
+        else:
+            location = LayerLocation.EXTERNAL
+            log_message = "💥 external data source 💥"
+
+    # EMPTY (and None for memory layers) can change without the source
+    # changing, so only stable classifications are cached.
+    if location is not None and location is not LayerLocation.EMPTY:
+        _location_cache[layer.id()] = (layer_source, location)
+        if len(_location_cache) > _LOCATION_CACHE_MAX_SIZE:
+            _location_cache.popitem(last=False)
 
     log_debug(f"Location Indicators → '{layer.name()}' → {log_message}")
     return location
@@ -78,17 +183,68 @@ def add_location_indicator(
     if location is None:
         return None
 
-    indicator = QgsLayerTreeViewIndicator()
-    indicator.setIcon(location.icon)
-    indicator.setToolTip(location.tooltip)
     if (
         project
         and (view := iface.layerTreeView())
         and (root := project.layerTreeRoot())
-        and (node := root.findLayer(layer.id()))
     ):
-        view.addIndicator(node, indicator)
-        log_debug(f"Location Indicators → '{layer.name()}' → adding indicator...")
-        return indicator
+        return _attach_indicator(view, root, layer, location)
 
     return None
+
+
+def add_location_indicators(
+    project: QgsProject, iface: QgisInterface, layers: "Iterable[QgsMapLayer]"
+) -> dict[str, QgsLayerTreeViewIndicator]:
+    """Add location indicators for several layers in one pass.
+
+    The layer tree view, layer tree root and project context are resolved
+    once for the whole batch instead of once per layer.
+
+    :param project: The current QGIS project.
+    :param iface: The QGIS interface.
+    :param layers: The layers to add indicators for.
+    :returns: A mapping of layer id to the created indicator.
+    """
+    indicators: dict[str, QgsLayerTreeViewIndicator] = {}
+    view = iface.layerTreeView()
+    root = project.layerTreeRoot() if project else None
+    if not view or not root:
+        return indicators
+
+    layer_list: list[QgsMapLayer] = list(layers)
+    locations: dict[str, LayerLocation | None] = get_layer_locations(layer_list)
+    for layer in layer_list:
+        location: LayerLocation | None = locations.get(layer.id())
+        if location is None:
+            continue
+        if indicator := _attach_indicator(view, root, layer, location):
+            indicators[layer.id()] = indicator
+
+    return indicators
+
+
+def _attach_indicator(
+    view: "QgsLayerTreeView",
+    root: "QgsLayerTree",
+    layer: QgsMapLayer,
+    location: LayerLocation,
+) -> QgsLayerTreeViewIndicator | None:
+    """Create an indicator for a classified layer and attach it to its node.
+
+    :param view: The layer tree view to attach the indicator to.
+    :param root: The layer tree root used to find the layer's node.
+    :param layer: The layer the indicator belongs to.
+    :param location: The determined location of the layer.
+    :returns: The attached indicator, or None if the layer has no node.
+    """
+    node = root.findLayer(layer.id())
+    if node is None:
+        return None
+
+    indicator = QgsLayerTreeViewIndicator()
+    indicator.setIcon(location.icon)
+    indicator.setToolTip(location.tooltip)
+    view.addIndicator(node, indicator)
+    log_debug(f"Location Indicators → '{layer.name()}' → adding indicator...")
+    return indicator
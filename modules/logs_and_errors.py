@@ -154,8 +154,10 @@ def log_summary_message(
         # fmt: on
         debug_level = Qgis.Info
         message_parts.append(msg_part)
-        for skipped_layer in skipped:
-            log_debug(f"Skipped layer '{skipped_layer}'", debug_level)
+        # One multi-line log entry instead of one logMessage call per layer.
+        log_debug(
+            "\n".join(f"Skipped layer '{name}'" for name in skipped), debug_level
+        )
 
     if failures:
         # fmt: off
@@ -163,8 +165,13 @@ def log_summary_message(
         # fmt: on
         debug_level = Qgis.Warning
         message_parts.append(msg_part)
-        for failure in failures:
-            log_debug(f"Failed to {action} {failure[0]}: {failure[1]}", debug_level)
+        log_debug(
+            "\n".join(
+                f"Failed to {action} {failure[0]}: {failure[1]}"
+                for failure in failures
+            ),
+            debug_level,
+        )
 
     if not message_parts:  # If no operations were reported
         # fmt: off
@@ -4,9 +4,7 @@ This module contains the function for renaming and moving layers
 in a QGIS project based on their group names.
 """
 
-import contextlib
 import json
-import re
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
@@ -23,13 +21,22 @@ from qgis.core import (
 from .constants import GEOMETRY_SUFFIX_MAP
 from .general import (
     get_current_project,
+    get_layer_tree_root,
     get_selected_layers,
-    raise_runtime_error,
 )
 from .logs_and_errors import log_debug, log_summary_message
+from .main_interface import get_iface
 
 if TYPE_CHECKING:
     from qgis.core import QgsLayerTree, QgsLayerTreeNode
+    from qgis.PyQt.QtCore import QAbstractItemModel
+
+# Translation table built once at import time. str.translate runs as a
+# tight C loop and is several times faster than re.sub for plain
+# character replacements.
+_INVALID_LAYER_CHARS_TABLE: dict[int, str] = str.maketrans(
+    dict.fromkeys('<>:"/\\|?*,', "_")
+)
 
 
 def fix_layer_name(name: str) -> str:
@@ -45,14 +52,13 @@ def fix_layer_name(name: str) -> str:
     :param name: The potentially garbled and raw layer name.
     :returns: A fixed and sanitized version of the name.
     """
-    fixed_name: str = name
-    with contextlib.suppress(UnicodeEncodeError):
-        fixed_name = name.encode("cp1252").decode("utf-8")
+    try:
+        fixed_name: str = name.encode("cp1252").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        fixed_name = name
 
     # Remove or replace problematic characters
-    sanitized_name: str = re.sub(r'[<>:"/\\|?*,]+', "_", fixed_name)
-
-    return sanitized_name
+    return fixed_name.translate(_INVALID_LAYER_CHARS_TABLE)
 
 
 def prepare_rename_plan() -> tuple[list[tuple[QgsMapLayer, str, str]], list[str]]:
@@ -69,10 +75,7 @@ def prepare_rename_plan() -> tuple[list[tuple[QgsMapLayer, str, str]], list[str]
         A tuple containing the rename plan, a list of skipped layer names, and a
         list of layer names that could not be found in the layer tree.
     """
-    project: QgsProject = get_current_project()
-    root: QgsLayerTree | None = project.layerTreeRoot()
-    if root is None:
-        raise_runtime_error("No Layer Tree is available.")
+    root: QgsLayerTree = get_layer_tree_root()
 
     layers_to_process: list[QgsMapLayer] = get_selected_layers()
 
@@ -80,34 +83,54 @@ def prepare_rename_plan() -> tuple[list[tuple[QgsMapLayer, str, str]], list[str]
     potential_renames: defaultdict[str, list[QgsMapLayer]] = defaultdict(list)
     skipped_layers: list[str] = []
 
+    # Many selected layers usually share the same parent group, so the
+    # mojibake fix and sanitization run once per group name, not per layer.
+    fixed_name_cache: dict[str, str] = {}
+
+    # Index the layer tree once: root.findLayer() walks the whole tree per
+    # call, which would make the loop below O(selection × tree size).
+    id_to_node: dict[str, QgsLayerTreeLayer] = {
+        tree_layer.layerId(): tree_layer for tree_layer in root.findLayers()
+    }
+
+    # Bind hot lookups to locals: LOAD_FAST is cheaper than the global and
+    # attribute lookups the loop body would otherwise repeat per layer.
+    skipped_append = skipped_layers.append
+    find_node = id_to_node.get
+
     log_debug(f"Renaming {len(layers_to_process)} layers...")
     for layer in layers_to_process:
-        node: QgsLayerTreeLayer | None = root.findLayer(layer.id())
+        # layer.name() crosses the SIP boundary; fetch it once per layer.
+        layer_name: str = layer.name()
+        node: QgsLayerTreeLayer | None = find_node(layer.id())
 
         # If the layer is not in the layer tree, skip it.
         if not node:
-            skipped_layers.append(layer.name())
-            log_debug(f"'{layer.name()}' → Rename → Skipped because not in layer tree.")
+            skipped_append(layer_name)
+            log_debug(f"'{layer_name}' → Rename → Skipped because not in layer tree.")
             continue
 
         # If a vector layer is empty, skip it.
         if isinstance(layer, QgsVectorLayer) and layer.featureCount() == 0:
-            skipped_layers.append(layer.name())
-            log_debug(f"'{layer.name()}' → Rename → Skipped because empty.")
+            skipped_append(layer_name)
+            log_debug(f"'{layer_name}' → Rename → Skipped because empty.")
             continue
 
         # If the layer is not in a group, skip it.
         parent: QgsLayerTreeNode | None = node.parent()
         raw_group_name: str = parent.name() if parent else ""
         if not isinstance(parent, QgsLayerTreeGroup) or not raw_group_name:
-            skipped_layers.append(layer.name())
-            log_debug(f"'{layer.name()}' → Rename → Skipped because not in a group.")
+            skipped_append(layer_name)
+            log_debug(f"'{layer_name}' → Rename → Skipped because not in a group.")
             continue
 
-        new_name_base: str = fix_layer_name(raw_group_name)
+        new_name_base: str | None = fixed_name_cache.get(raw_group_name)
+        if new_name_base is None:
+            new_name_base = fix_layer_name(raw_group_name)
+            fixed_name_cache[raw_group_name] = new_name_base
         if not new_name_base:
-            skipped_layers.append(layer.name())
-            log_debug(f"'{layer.name()}' → Rename → Skipped because invalid name.")
+            skipped_append(layer_name)
+            log_debug(f"'{layer_name}' → Rename → Skipped because invalid name.")
             continue
 
         potential_renames[new_name_base].append(layer)
@@ -174,14 +197,29 @@ def execute_rename_plan(
     failed_renames: list = []
     successful_renames: list[tuple[str, str, str]] = []
 
-    for layer, old_name, new_layer_name in rename_plan:
-        try:
-            layer.setName(new_layer_name)
-            # On success, record the change for the undo stack.
-            successful_renames.append((layer.id(), old_name, new_layer_name))
-        except RuntimeError as e:  # noqa: PERF203
-            # If setName fails, the layer name is unchanged.
-            failed_renames.append((old_name, new_layer_name, str(e)))
+    # Each setName() fires nameChanged, which the layer-tree model turns
+    # into a view update. Block the model's signals for the duration of
+    # the batch so the tree view repaints once instead of once per layer.
+    model: QAbstractItemModel | None = None
+    iface = get_iface()
+    if iface and (view := iface.layerTreeView()):
+        model = view.model()
+
+    if model is not None:
+        model.blockSignals(True)
+    try:
+        for layer, old_name, new_layer_name in rename_plan:
+            try:
+                layer.setName(new_layer_name)
+                # On success, record the change for the undo stack.
+                successful_renames.append((layer.id(), old_name, new_layer_name))
+            except RuntimeError as e:  # noqa: PERF203
+                # If setName fails, the layer name is unchanged.
+                failed_renames.append((old_name, new_layer_name, str(e)))
+    finally:
+        if model is not None:
+            model.blockSignals(False)
+            model.layoutChanged.emit()
 
     if failed_renames:
         log_debug(